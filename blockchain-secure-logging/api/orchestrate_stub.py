@@ -8,9 +8,15 @@ from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 API_ROOT = "http://localhost:8000/api/v1"
 
+# One keep-alive session shared by the generate -> anchor -> verify sequence.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 
 def _pretty_print(title: str, payload: Dict[str, Any]) -> None:
     print(f"\n=== {title} ===")
@@ -26,7 +32,7 @@ class BatchContext:
 
 
 def generate_batch(batch_id: str) -> BatchContext:
-    response = requests.post(
+    response = _SESSION.post(
         f"{API_ROOT}/batches",
         json={"batch_id": batch_id},
         timeout=30,
@@ -43,7 +49,7 @@ def generate_batch(batch_id: str) -> BatchContext:
 
 
 def anchor_batch(context: BatchContext) -> str:
-    response = requests.post(
+    response = _SESSION.post(
         f"{API_ROOT}/anchors",
         json={"batch_id": context.batch_id, "merkle_root": context.root},
         timeout=30,
@@ -55,7 +61,7 @@ def anchor_batch(context: BatchContext) -> str:
 
 
 def verify_batch(context: BatchContext, tx_hash: str) -> None:
-    response = requests.post(
+    response = _SESSION.post(
         f"{API_ROOT}/verifications",
         json={"batch_id": context.batch_id, "log_entry": {}},
         timeout=30,
@@ -3,35 +3,51 @@
 from __future__ import annotations
 
 import json
-import random
-import string
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import secrets
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Tuple
 
 HOST, PORT = "0.0.0.0", 8000
+POST_PATHS = frozenset({"/api/v1/batches", "/api/v1/anchors", "/api/v1/verifications"})
 
 
 def _json_response(handler: BaseHTTPRequestHandler, status: int, payload: dict) -> None:
     body = json.dumps(payload).encode("utf-8")
-    handler.send_response(status)
-    handler.send_header("Content-Type", "application/json")
-    handler.send_header("Content-Length", str(len(body)))
-    handler.end_headers()
-    handler.wfile.write(body)
+    # parse_request() sets close_connection for "Connection: close" and
+    # HTTP/1.0 clients; advertise what the server will actually do.
+    connection = "close" if handler.close_connection else "keep-alive"
+    handler.log_request(status)
+    # Assemble status line, headers, and body up front so each response leaves
+    # the process in a single write instead of one per header plus the body.
+    head = (
+        f"{handler.protocol_version} {status} {HTTPStatus(status).phrase}\r\n"
+        f"Server: {handler.version_string()}\r\n"
+        f"Date: {handler.date_time_string()}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {connection}\r\n\r\n"
+    ).encode("latin-1")
+    handler.wfile.write(head + body)
+    handler.wfile.flush()
+
+
+def _read_body(handler: BaseHTTPRequestHandler) -> bytes:
+    length = int(handler.headers.get("Content-Length", 0))
+    return handler.rfile.read(length) if length else b""
 
 
 def _read_json(handler: BaseHTTPRequestHandler) -> dict:
-    length = int(handler.headers.get("Content-Length", 0))
-    data = handler.rfile.read(length) if length else b"{}"
-    return json.loads(data or b"{}")
+    return json.loads(_read_body(handler) or b"{}")
 
 
 def _rand_hex(prefix: str, length: int = 64) -> str:
-    return f"0x{''.join(random.choices(string.hexdigits.lower(), k=length))}"
+    return "0x" + secrets.token_hex(length // 2)
 
 
 class LoggingAPI(BaseHTTPRequestHandler):
     server_version = "LoggingAPIStub/0.1"
+    protocol_version = "HTTP/1.1"
 
     def do_GET(self) -> None:  # noqa: N802
         if self.path == "/healthz":
@@ -40,8 +56,14 @@ class LoggingAPI(BaseHTTPRequestHandler):
             _json_response(self, 404, {"detail": "Not found"})
 
     def do_POST(self) -> None:  # noqa: N802
+        if self.path not in POST_PATHS:
+            # Drain the body unparsed so a kept-alive connection stays in sync.
+            _read_body(self)
+            _json_response(self, 404, {"detail": "Not found"})
+            return
+
+        payload = _read_json(self)
         if self.path == "/api/v1/batches":
-            payload = _read_json(self)
             batch_id = payload.get("batch_id", "demo-batch")
             response = {
                 "batch_id": batch_id,
@@ -52,15 +74,13 @@ class LoggingAPI(BaseHTTPRequestHandler):
             }
             _json_response(self, 200, response)
         elif self.path == "/api/v1/anchors":
-            payload = _read_json(self)
             response = {
                 "batch_id": payload.get("batch_id", "demo-batch"),
                 "tx_hash": _rand_hex("tx"),
                 "anchor_height": 1,
             }
             _json_response(self, 200, response)
-        elif self.path == "/api/v1/verifications":
-            payload = _read_json(self)
+        else:  # /api/v1/verifications
             response = {
                 "batch_id": payload.get("batch_id", "demo-batch"),
                 "verified": True,
@@ -68,12 +88,10 @@ class LoggingAPI(BaseHTTPRequestHandler):
                 "tx_hash": payload.get("tx_hash", _rand_hex("tx")),
             }
             _json_response(self, 200, response)
-        else:
-            _json_response(self, 404, {"detail": "Not found"})
 
 
 def serve(address: Tuple[str, int] = (HOST, PORT)) -> None:
-    with HTTPServer(address, LoggingAPI) as httpd:
+    with ThreadingHTTPServer(address, LoggingAPI) as httpd:
         host, port = httpd.server_address
         print(f"Logging API stub listening on http://{host}:{port}")
         httpd.serve_forever()
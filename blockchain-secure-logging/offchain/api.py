@@ -17,9 +17,12 @@ Run the API with::
 from __future__ import annotations
 
 import copy
+import functools
 import json
 import pathlib
-from typing import Any, Dict, Iterable, List, MutableMapping, Optional, Tuple
+import threading
+import time
+from typing import Any, Dict, Hashable, Iterable, List, MutableMapping, Optional, Tuple
 
 from fastapi import FastAPI, HTTPException, Query, status
 from pydantic import BaseModel, Field
@@ -34,6 +37,13 @@ BASE_DIR = pathlib.Path(__file__).resolve().parent
 DEFAULT_CONFIG_PATH = BASE_DIR / "config.yaml"
 DEFAULT_MANIFEST_DIR = BASE_DIR / "manifests"
 
+# Verification results stay valid until the manifest changes or a newer anchor
+# moves ``latestRoot``; the on-chain root itself is re-read at most every few
+# seconds so bursts of repeat /verify calls skip both hashing and RPC.
+VERIFY_CACHE_TTL_SECONDS = 30.0
+VERIFY_CACHE_MAXSIZE = 10_000
+CHAIN_ROOT_CACHE_TTL_SECONDS = 5.0
+
 # Minimal ABI for the LogAnchor contract. Used when the configured ABI path is
 # missing to keep the API self-contained.
 DEFAULT_LOG_ANCHOR_ABI: List[Dict[str, Any]] = [
@@ -117,17 +127,26 @@ def _deep_update(target: MutableMapping[str, Any], overrides: MutableMapping[str
             target[key] = value
 
 
+@functools.lru_cache(maxsize=16)
+def _read_abi_file(path: pathlib.Path, mtime_ns: int) -> List[Dict[str, Any]]:
+    # ``mtime_ns`` only participates in the cache key so edits to the ABI file
+    # are picked up without restarting the service.
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
 def _load_chain_abi(chain_cfg: Dict[str, Any]) -> List[Dict[str, Any]]:
     abi_path = chain_cfg.get("contract_abi_path")
     if not abi_path:
         return DEFAULT_LOG_ANCHOR_ABI
 
     resolved = (DEFAULT_CONFIG_PATH.parent / pathlib.Path(abi_path)).resolve()
-    if not resolved.exists():
+    try:
+        mtime_ns = resolved.stat().st_mtime_ns
+    except FileNotFoundError:
         return DEFAULT_LOG_ANCHOR_ABI
 
-    with resolved.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return _read_abi_file(resolved, mtime_ns)
 
 
 def _get_web3(chain_cfg: Dict[str, Any]) -> Web3:
@@ -145,6 +164,11 @@ def _get_web3(chain_cfg: Dict[str, Any]) -> Web3:
 def _bytes32(value: Optional[str]) -> bytes:
     if not value:
         return b"\x00" * 32
+    return _decode_bytes32(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_bytes32(value: str) -> bytes:
     stripped = value[2:] if value.startswith("0x") else value
     if len(stripped) != 64:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, f"Expected 32-byte hex value, got {value}")
@@ -252,6 +276,71 @@ def _fetch_on_chain_root(config: Dict[str, Any]) -> Optional[str]:
     return Web3.to_hex(root_bytes)
 
 
+class _TTLCache:
+    """Small thread-safe mapping whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                for stale in [k for k, (expires_at, _) in self._data.items() if expires_at <= now]:
+                    del self._data[stale]
+                while len(self._data) >= self.maxsize:
+                    del self._data[next(iter(self._data))]
+            self._data[key] = (now + self.ttl, value)
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_verify_cache = _TTLCache(VERIFY_CACHE_TTL_SECONDS, VERIFY_CACHE_MAXSIZE)
+_chain_root_cache = _TTLCache(CHAIN_ROOT_CACHE_TTL_SECONDS, 64)
+
+
+def _chain_root_key(config: Dict[str, Any]) -> Tuple[Any, Any]:
+    chain_cfg = config.get("chain", {})
+    return (chain_cfg.get("rpc_url"), chain_cfg.get("contract_address"))
+
+
+def _cached_on_chain_root(config: Dict[str, Any]) -> Optional[str]:
+    key = _chain_root_key(config)
+    cached = _chain_root_cache.get(key)
+    if cached is not None:
+        return cached[0]
+
+    try:
+        root = _fetch_on_chain_root(config)
+    except HTTPException:
+        raise
+    except Exception as exc:  # pragma: no cover - network related issues
+        raise HTTPException(status.HTTP_502_BAD_GATEWAY, f"Failed to fetch on-chain root: {exc}") from exc
+    _chain_root_cache.set(key, (root,))
+    return root
+
+
 def _load_manifest(path: pathlib.Path) -> Dict[str, Any]:
     if not path.exists():
         raise HTTPException(status.HTTP_404_NOT_FOUND, f"Manifest not found at {path}")
@@ -260,11 +349,25 @@ def _load_manifest(path: pathlib.Path) -> Dict[str, Any]:
 
 
 def _prepare_entries(entries: Iterable[LogEntry]) -> List[Dict[str, Any]]:
-    return [json.loads(entry.json()) for entry in entries]
+    return [entry.dict() for entry in entries]
 
 
-def _reconstruct_entries(entries_payload: List[Dict[str, Any]]) -> List[LogEntry]:
-    return [LogEntry.parse_obj(payload) for payload in entries_payload]
+def _manifest_proof(manifest: Dict[str, Any], entry_index: int) -> List[Tuple[str, bytes]]:
+    """Return the sibling path for ``entry_index`` using data persisted in the manifest.
+
+    Proofs serialized by :func:`offchain.batcher.build_manifest` are decoded
+    directly. Older manifests that only carry ``leaves`` fall back to rebuilding
+    the proof from the stored leaf hashes, so no entry is re-hashed either way.
+    """
+
+    serialized = (manifest.get("proofs") or {}).get(str(entry_index))
+    if serialized is not None:
+        return [(item["direction"], _bytes32(item["hash"])) for item in serialized]
+
+    leaves_hex = manifest.get("leaves")
+    if not leaves_hex:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Manifest does not include leaf hashes")
+    return merkle.merkle_proof(entry_index, [_bytes32(leaf_hex) for leaf_hex in leaves_hex])
 
 
 app = FastAPI(title="Secure Log Anchoring API", version="0.1.0")
@@ -288,6 +391,9 @@ def anchor_batch(request: AnchorBatchRequest) -> AnchorBatchResponse:
     manifest["entries"] = _prepare_entries(batch_inputs.entries)
 
     tx_hash, receipt_data = _anchor_on_chain(config, request.batch_id, manifest, request.wait_for_receipt)
+    # The anchor moved ``latestRoot``; drop the cached tip so the next /verify
+    # re-reads it instead of comparing against the previous batch's root.
+    _chain_root_cache.discard(_chain_root_key(config))
     manifest["chain"] = {"tx_hash": tx_hash, "receipt": receipt_data}
 
     manifest_path = persist_manifest(manifest, request.batch_id, manifest_dir)
@@ -314,6 +420,17 @@ def verify(
     manifest_directory = _resolve_manifest_dir(config, manifest_dir)
     manifest_path = manifest_directory / f"{batch_id}.manifest.json"
 
+    cache_key: Optional[Tuple[Any, ...]] = None
+    try:
+        cache_key = (str(manifest_path), manifest_path.stat().st_mtime_ns, entry_index)
+    except FileNotFoundError:
+        pass  # _load_manifest reports the missing manifest below.
+
+    if cache_key is not None:
+        cached: Optional[VerificationResponse] = _verify_cache.get(cache_key)
+        if cached is not None and cached.on_chain_root == _cached_on_chain_root(config):
+            return cached
+
     manifest = _load_manifest(manifest_path)
     manifest_batch = manifest.get("batch", {})
     if manifest_batch.get("batch_id") != batch_id:
@@ -323,18 +440,18 @@ def verify(
     if not entries_payload:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Manifest does not include serialized entries")
 
-    try:
-        entries = _reconstruct_entries(entries_payload)
-    except Exception as exc:  # pragma: no cover - defensive branch
-        raise HTTPException(status.HTTP_400_BAD_REQUEST, f"Failed to parse entries: {exc}") from exc
-
-    if entry_index >= len(entries):
+    if entry_index >= len(entries_payload):
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Entry index out of range for manifest")
 
-    leaves = [merkle.leaf_hash(entry) for entry in entries]
-    leaf = leaves[entry_index]
+    # Only the requested entry is re-hashed; siblings come from the manifest so
+    # verification costs O(log N) hashes instead of a full pass over the batch.
+    try:
+        entry = LogEntry.parse_obj(entries_payload[entry_index])
+    except Exception as exc:  # pragma: no cover - defensive branch
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, f"Failed to parse entry: {exc}") from exc
 
-    proof = merkle.merkle_proof(entry_index, leaves)
+    leaf = merkle.leaf_hash(entry)
+    proof = _manifest_proof(manifest, entry_index)
     root_hex = manifest_batch.get("root")
     if not root_hex:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Manifest missing Merkle root")
@@ -345,18 +462,12 @@ def verify(
         {"direction": direction, "hash": "0x" + sibling.hex()} for direction, sibling in proof
     ]
 
-    on_chain_root = None
-    try:
-        on_chain_root = _fetch_on_chain_root(config)
-    except HTTPException:
-        raise
-    except Exception as exc:  # pragma: no cover - network related issues
-        raise HTTPException(status.HTTP_502_BAD_GATEWAY, f"Failed to fetch on-chain root: {exc}") from exc
+    on_chain_root = _cached_on_chain_root(config)
 
     root_matches_chain = bool(on_chain_root and on_chain_root.lower() == root_hex.lower())
     verified = proof_valid and root_matches_chain
 
-    return VerificationResponse(
+    response = VerificationResponse(
         batch_id=batch_id,
         entry_index=entry_index,
         leaf="0x" + leaf.hex(),
@@ -367,6 +478,9 @@ def verify(
         root_matches_chain=root_matches_chain,
         verified=verified,
     )
+    if cache_key is not None:
+        _verify_cache.set(cache_key, response)
+    return response
 
 
 __all__ = ["app"]
@@ -17,11 +17,16 @@ from __future__ import annotations
 
 import argparse
 import json
+import multiprocessing
+import os
 import pathlib
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Iterable, List, Sequence
+from typing import Dict, Iterable, List, Sequence
 
 try:
     import yaml
@@ -35,6 +40,18 @@ if __package__ in {None, ""}:  # pragma: no cover - exercised via subprocess CLI
 from . import merkle
 from .schemas import BatchMeta, LogEntry
 
+# Batches smaller than this are hashed in-process. Measured with a warm pool:
+# serial hashing costs ~6-7 us per entry, while shipping an entry's parts to a
+# worker and its digest back costs ~2 us plus a few ms of dispatch per call.
+# With two to four workers that only pays off reliably past ~8k entries.
+PARALLEL_HASH_THRESHOLD = 8192
+
+# Worker pools are created once per size and reused across batches. They use
+# forkserver (or spawn) rather than fork so callers running inside a threaded
+# server, such as the FastAPI app, never fork a process that holds threads.
+_HASH_EXECUTORS: Dict[int, ProcessPoolExecutor] = {}
+_HASH_EXECUTORS_LOCK = threading.Lock()
+
 
 @dataclass
 class BatchInputs:
@@ -56,7 +73,8 @@ def load_config(path: pathlib.Path) -> dict:
 
 
 def read_jsonl(path: pathlib.Path) -> Iterable[LogEntry]:
-    with path.open("r", encoding="utf-8") as handle:
+    # Lines stay as bytes so orjson can parse them without a decode pass.
+    with path.open("rb") as handle:
         for line in handle:
             if not line.strip():
                 continue
@@ -81,8 +99,55 @@ def gather_entries(config: dict) -> BatchInputs:
     return BatchInputs(entries=entries, prev_root=prev_root)
 
 
+def _hash_executor(workers: int) -> ProcessPoolExecutor:
+    with _HASH_EXECUTORS_LOCK:
+        executor = _HASH_EXECUTORS.get(workers)
+        if executor is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            executor = _HASH_EXECUTORS[workers] = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        return executor
+
+
+def _discard_hash_executor(workers: int, executor: ProcessPoolExecutor) -> None:
+    with _HASH_EXECUTORS_LOCK:
+        if _HASH_EXECUTORS.get(workers) is executor:
+            del _HASH_EXECUTORS[workers]
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def hash_leaves(
+    entries: Sequence[LogEntry],
+    parallel_threshold: int = PARALLEL_HASH_THRESHOLD,
+    max_workers: int | None = None,
+) -> List[bytes]:
+    """Return leaf hashes in entry order, fanning large batches out to processes."""
+
+    workers = max_workers or os.cpu_count() or 1
+    if len(entries) < parallel_threshold or workers < 2:
+        return merkle.leaf_hashes(entries)
+
+    # Workers receive plain tuples in contiguous slices: pickling LogEntry
+    # dataclasses costs about as much as hashing them, and slicing keeps IPC
+    # to a few round trips per worker instead of one per entry.
+    parts = [merkle.leaf_parts(entry) for entry in entries]
+    step = -(-len(parts) // (workers * 4))
+    chunks = [parts[start : start + step] for start in range(0, len(parts), step)]
+    executor = None
+    try:
+        executor = _hash_executor(workers)
+        leaves: List[bytes] = []
+        for chunk_leaves in executor.map(merkle.leaf_hashes_from_parts, chunks):
+            leaves.extend(chunk_leaves)
+        return leaves
+    except (OSError, BrokenProcessPool):  # pragma: no cover - no process support or a dead worker
+        if executor is not None:
+            _discard_hash_executor(workers, executor)
+        return merkle.leaf_hashes(entries)
+
+
 def build_manifest(batch_id: str, entries: Sequence[LogEntry], prev_root: str | None) -> dict:
-    leaves = [merkle.leaf_hash(entry) for entry in entries]
+    leaves = hash_leaves(entries)
     root = merkle.merkle_root(leaves)
     batch_meta = BatchMeta(
         batch_id=batch_id,
@@ -103,7 +168,7 @@ def build_manifest(batch_id: str, entries: Sequence[LogEntry], prev_root: str |
     }
 
     manifest = {
-        "batch": json.loads(batch_meta.json()),
+        "batch": batch_meta.dict(),
         "leaves": ["0x" + leaf.hex() for leaf in leaves],
         "proofs": proofs,
     }
@@ -4,28 +4,49 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Iterable, List, Sequence, Tuple
+from typing import Any, Iterable, List, Mapping, Sequence, Tuple
 
-from .schemas import ISOFORMAT, LogEntry
+from .schemas import LogEntry, format_timestamp, parse_leaf_parts
 
+# ``json.dumps`` builds a fresh encoder whenever non-default options are given;
+# reusing one configured instance keeps canonical output identical but cheaper.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+LeafParts = Tuple[str, str, str, str, Mapping[str, Any]]
 
-def canonical_leaf(entry: LogEntry) -> bytes:
-    """Serialize a :class:`LogEntry` into canonical JSON bytes."""
 
+def _canonical_bytes(ts: str, source_id: str, level: str, msg: str, fields: Mapping[str, Any]) -> bytes:
     payload = {
-        "ts": entry.ts.strftime(ISOFORMAT),
-        "source_id": entry.source_id,
-        "level": entry.level,
-        "msg": entry.msg,
+        "ts": ts,
+        "source_id": source_id,
+        "level": level,
+        "msg": msg,
     }
-    if entry.fields:
-        reserved_keys = payload.keys() & entry.fields.keys()
+    if fields:
+        reserved_keys = payload.keys() & fields.keys()
         if reserved_keys:
             reserved = ", ".join(sorted(reserved_keys))
             raise ValueError(f"Log entry fields cannot override reserved keys: {reserved}")
-        payload.update(entry.fields)
+        payload.update(fields)
 
-    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return _CANONICAL_ENCODER.encode(payload).encode("utf-8")
+
+
+def canonical_leaf(entry: LogEntry) -> bytes:
+    """Serialize a :class:`LogEntry` into canonical JSON bytes."""
+
+    return _canonical_bytes(*leaf_parts(entry))
+
+
+def leaf_parts(entry: LogEntry) -> LeafParts:
+    """Return the plain values hashed for ``entry``.
+
+    The tuple pickles far more cheaply than the dataclass, which matters when
+    leaves are hashed in worker processes.
+    """
+
+    return (format_timestamp(entry.ts), entry.source_id, entry.level, entry.msg, entry.fields)
 
 
 def leaf_hash(entry: LogEntry) -> bytes:
@@ -34,6 +55,29 @@ def leaf_hash(entry: LogEntry) -> bytes:
     return hashlib.sha256(canonical_leaf(entry)).digest()
 
 
+def leaf_hash_from_raw(line: str | bytes) -> bytes:
+    """Hash a raw JSON log line without materializing a :class:`LogEntry`.
+
+    Produces the same digest as ``leaf_hash(LogEntry.parse_raw(line))``.
+    """
+
+    return hashlib.sha256(_canonical_bytes(*parse_leaf_parts(line))).digest()
+
+
+def leaf_hashes(entries: Sequence[LogEntry]) -> List[bytes]:
+    """Compute leaf hashes for a whole batch, preserving entry order."""
+
+    sha256 = hashlib.sha256
+    return [sha256(canonical_leaf(entry)).digest() for entry in entries]
+
+
+def leaf_hashes_from_parts(parts: Sequence[LeafParts]) -> List[bytes]:
+    """Compute leaf hashes from :func:`leaf_parts` tuples, preserving order."""
+
+    sha256 = hashlib.sha256
+    return [sha256(_canonical_bytes(*item)).digest() for item in parts]
+
+
 def _pairwise(iterable: Sequence[bytes]) -> Iterable[Tuple[bytes, bytes]]:
     for i in range(0, len(iterable), 2):
         left = iterable[i]
@@ -52,15 +96,18 @@ def merkle_tree_levels(leaves: Sequence[bytes]) -> List[List[bytes]]:
     if not leaves:
         raise ValueError("Cannot build Merkle tree with no leaves")
 
+    sha256 = hashlib.sha256
     levels: List[List[bytes]] = [list(leaves)]
     while len(levels[-1]) > 1:
         level = list(levels[-1])
         if len(level) % 2 == 1:
             level.append(level[-1])
 
-        next_level: List[bytes] = []
-        for left, right in _pairwise(level):
-            next_level.append(hashlib.sha256(left + right).digest())
+        # Parent count is known up front, so fill a presized list rather than
+        # growing it one append at a time.
+        next_level: List[bytes] = [b""] * (len(level) // 2)
+        for index, (left, right) in enumerate(_pairwise(level)):
+            next_level[index] = sha256(left + right).digest()
         levels.append(next_level)
 
     return levels
@@ -111,12 +158,13 @@ def merkle_proofs(leaves: Sequence[bytes]) -> List[List[Tuple[str, bytes]]]:
 def verify_proof(leaf: bytes, proof: Sequence[Tuple[str, bytes]], expected_root: bytes) -> bool:
     """Verify that ``leaf`` is part of the tree defined by ``expected_root``."""
 
+    sha256 = hashlib.sha256
     computed = leaf
     for direction, sibling in proof:
         if direction == "right":
-            computed = hashlib.sha256(computed + sibling).digest()
+            computed = sha256(computed + sibling).digest()
         elif direction == "left":
-            computed = hashlib.sha256(sibling + computed).digest()
+            computed = sha256(sibling + computed).digest()
         else:
             raise ValueError(f"Unknown direction {direction}")
     return computed == expected_root
@@ -125,6 +173,10 @@ def verify_proof(leaf: bytes, proof: Sequence[Tuple[str, bytes]], expected_root:
 __all__ = [
     "canonical_leaf",
     "leaf_hash",
+    "leaf_hash_from_raw",
+    "leaf_hashes",
+    "leaf_hashes_from_parts",
+    "leaf_parts",
     "merkle_root",
     "merkle_tree_levels",
     "merkle_proof_from_levels",
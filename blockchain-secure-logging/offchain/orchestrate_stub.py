@@ -13,6 +13,7 @@ fail fast when the API deviates from the expected happy path.
 """
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
@@ -22,10 +23,47 @@ from typing import Any, Dict, Optional
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 LOGGER = logging.getLogger(__name__)
 DEFAULT_CONFIG_FILENAME = "stub_config.yaml"
 DEFAULT_TIMEOUT = (5, 30)  # (connect, read) seconds
+DEFAULT_MERKLE_ROOT = "0x" + "00" * 32
+DEFAULT_PREV_MERKLE_ROOT = "0x" + "11" * 32
+
+
+def _build_session() -> requests.Session:
+    # urllib3 only retries idempotent methods by default, so the anchoring POST
+    # is never replayed; GET /verify retries transient gateway errors.
+    retry = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# PyYAML's libyaml bindings parse the same safe subset several times faster.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    # ``mtime_ns`` is part of the cache key so edits are picked up on the next
+    # call. Callers must treat the returned mapping as read-only.
+    with open(path, "r", encoding="utf-8") as handle:
+        return yaml.load(handle, Loader=_YAML_LOADER) or {}
+
+
+def _read_config(path: Path) -> Dict[str, Any]:
+    LOGGER.debug("Loading stub configuration from %s", path)
+    return _load_yaml(str(path), path.stat().st_mtime_ns)
+
+
+# Shared across run_demo calls so repeated runs reuse pooled keep-alive
+# connections. Per-run credentials are passed per request, never stored here.
+_SESSION = _build_session()
 
 
 @dataclass
@@ -57,13 +95,11 @@ def load_settings() -> StubSettings:
         path = Path(config_path).expanduser()
         if not path.exists():
             raise FileNotFoundError(f"Configured stub config not found: {path}")
-        LOGGER.debug("Loading stub configuration from %s", path)
-        config = yaml.safe_load(path.read_text()) or {}
+        config = _read_config(path)
     else:
         default_path = Path(__file__).with_name(DEFAULT_CONFIG_FILENAME)
         if default_path.exists():
-            LOGGER.debug("Loading stub configuration from %s", default_path)
-            config = yaml.safe_load(default_path.read_text()) or {}
+            config = _read_config(default_path)
 
     env_api_base = os.getenv("ORCHESTRATE_API_BASE_URL")
     api_base_url = env_api_base or config.get("api_base_url")
@@ -83,10 +119,10 @@ def load_settings() -> StubSettings:
     else:
         anchor_payload["batch_id"] = batch_id
 
-    anchor_payload.setdefault("merkle_root", os.getenv("ORCHESTRATE_MERKLE_ROOT", "0x" + "00" * 32))
+    anchor_payload.setdefault("merkle_root", os.getenv("ORCHESTRATE_MERKLE_ROOT", DEFAULT_MERKLE_ROOT))
     anchor_payload.setdefault(
         "prev_merkle_root",
-        os.getenv("ORCHESTRATE_PREV_MERKLE_ROOT", "0x" + "11" * 32),
+        os.getenv("ORCHESTRATE_PREV_MERKLE_ROOT", DEFAULT_PREV_MERKLE_ROOT),
     )
     anchor_payload.setdefault(
         "network",
@@ -112,11 +148,15 @@ def load_settings() -> StubSettings:
 
 
 def _log_request(method: str, url: str, payload: Optional[Dict[str, Any]]) -> None:
+    if not LOGGER.isEnabledFor(logging.INFO):
+        return
     pretty_payload = json.dumps(payload, sort_keys=True, indent=2) if payload else "{}"
     LOGGER.info("%s %s\nRequest body:%s\n%s", method.upper(), url, os.linesep, pretty_payload)
 
 
 def _log_response(response: requests.Response) -> None:
+    if not LOGGER.isEnabledFor(logging.INFO):
+        return
     try:
         body = response.json()
         pretty_body = json.dumps(body, sort_keys=True, indent=2)
@@ -136,9 +176,10 @@ def run_demo(settings: Optional[StubSettings] = None) -> Dict[str, Any]:
 
     settings = settings or load_settings()
 
-    session = requests.Session()
+    session = _SESSION
+    headers: Dict[str, str] = {}
     if settings.api_token:
-        session.headers.update({"Authorization": f"Bearer {settings.api_token}"})
+        headers["Authorization"] = f"Bearer {settings.api_token}"
 
     LOGGER.debug("Using API base URL: %s", settings.api_base_url)
     if settings.ganache_rpc_url:
@@ -149,6 +190,7 @@ def run_demo(settings: Optional[StubSettings] = None) -> Dict[str, Any]:
     anchor_resp = session.post(
         settings.anchor_url,
         json=settings.anchor_payload,
+        headers=headers,
         timeout=DEFAULT_TIMEOUT,
     )
     _log_response(anchor_resp)
@@ -163,6 +205,7 @@ def run_demo(settings: Optional[StubSettings] = None) -> Dict[str, Any]:
     verify_resp = session.get(
         settings.verify_url,
         params=settings.verify_params,
+        headers=headers,
         timeout=DEFAULT_TIMEOUT,
     )
     _log_response(verify_resp)
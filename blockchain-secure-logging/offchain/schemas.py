@@ -10,12 +10,73 @@ rest of the pipeline keeps working unchanged.
 from __future__ import annotations
 
 import json
+import math
+import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 ISOFORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
+# Strings already in ISOFORMAT take the C-level ``fromisoformat`` fast path;
+# anything else goes through ``strptime`` so the accepted input is unchanged.
+_ISOFORMAT_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}Z")
+
+# Any integer literal this long might not fit in 64 bits.
+_LONG_DIGITS_BYTES = re.compile(rb"[0-9]{19,}")
+_LONG_DIGITS_STR = re.compile(r"[0-9]{19,}")
+
+
+def _loads(raw: str | bytes) -> Any:
+    """Parse a JSON document, preferring orjson when installed.
+
+    orjson rejects NaN literals and may coerce integers wider than 64 bits to
+    floats, which would silently change canonical leaf hashes. Documents it
+    rejects, or that contain a long digit run, are parsed with :mod:`json`.
+    """
+
+    if orjson is not None:
+        pattern = _LONG_DIGITS_BYTES if isinstance(raw, bytes) else _LONG_DIGITS_STR
+        if pattern.search(raw) is None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(raw)
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Return True if ``value`` holds a NaN or infinite float at any depth."""
+
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+def _dumps(payload: Mapping[str, Any]) -> str:
+    """Serialize ``payload`` as compact JSON, preferring orjson when installed.
+
+    orjson writes NaN and Infinity as ``null`` without raising, so payloads
+    holding them go to :mod:`json`, which keeps the literals ``_loads`` accepts.
+    orjson raises on integers wider than 64 bits; those fall back as well.
+    """
+
+    if orjson is not None and not _has_non_finite(payload):
+        try:
+            return orjson.dumps(payload).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(payload, separators=(",", ":"))
+
 
 def _ensure_datetime(value: Any) -> datetime:
     if isinstance(value, datetime):
@@ -25,10 +86,28 @@ def _ensure_datetime(value: Any) -> datetime:
     if isinstance(value, (int, float)):
         return datetime.fromtimestamp(value, tz=timezone.utc)
     if isinstance(value, str):
+        if _ISOFORMAT_RE.fullmatch(value):
+            return datetime.fromisoformat(value[:-1]).replace(tzinfo=timezone.utc)
         return datetime.strptime(value, ISOFORMAT).replace(tzinfo=timezone.utc)
     raise TypeError(f"Unsupported timestamp type: {type(value)!r}")
 
 
+def format_timestamp(value: datetime) -> str:
+    """Render ``value`` in :data:`ISOFORMAT` without going through ``strftime``.
+
+    The output is byte-for-byte what glibc's ``strftime(ISOFORMAT)`` produced
+    before, including the unpadded year before 1000 (``999-01-02T...``), so
+    leaf hashes of already anchored entries do not change. Like ``strftime``
+    the wall-clock fields are emitted as-is; callers pass UTC datetimes as
+    produced by the parsers in this module.
+    """
+
+    return (
+        f"{value.year}-{value.month:02d}-{value.day:02d}"
+        f"T{value.hour:02d}:{value.minute:02d}:{value.second:02d}Z"
+    )
+
+
 def _validate_hex32(value: Optional[str]) -> Optional[str]:
     if value is None:
         return None
@@ -40,22 +119,55 @@ def _validate_hex32(value: Optional[str]) -> Optional[str]:
     if len(normalized) != 66:
         raise ValueError(f"Expected 32-byte hex string, got {value}")
     hex_part = normalized[2:]
-    if any(c not in "0123456789abcdef" for c in hex_part):
-        raise ValueError(f"Expected hexadecimal characters, got {value}")
+    # ``bytes.fromhex`` validates in C; the isascii/isalnum guard rejects the
+    # whitespace it would otherwise tolerate between byte pairs.
+    try:
+        if not (hex_part.isascii() and hex_part.isalnum()):
+            raise ValueError
+        bytes.fromhex(hex_part)
+    except ValueError:
+        raise ValueError(f"Expected hexadecimal characters, got {value}") from None
     return normalized
 
 
+_BASE_KEYS: frozenset[str] = frozenset({"ts", "source_id", "level", "msg", "fields"})
+
+
 def _canonical_fields(payload: Mapping[str, Any]) -> Dict[str, Any]:
-    base_keys = {"ts", "source_id", "level", "msg", "fields"}
     dynamic: Dict[str, Any] = {}
     for key, val in payload.items():
-        if key not in base_keys:
+        if key not in _BASE_KEYS:
             dynamic[key] = val
     fields_payload = dict(payload.get("fields") or {})
     fields_payload.update(dynamic)
     return fields_payload
 
 
+def _required_fields(payload: Mapping[str, Any]) -> Tuple[datetime, str, str, str]:
+    """Normalize the required entry fields shared by both parsing paths."""
+
+    try:
+        ts = _ensure_datetime(payload["ts"])
+        source_id = str(payload["source_id"])
+        level = str(payload["level"])
+        msg = str(payload["msg"])
+    except KeyError as exc:
+        raise ValueError(f"Missing required field {exc.args[0]}") from exc
+    return ts, source_id, level, msg
+
+
+def parse_leaf_parts(raw: str | bytes) -> Tuple[str, str, str, str, Dict[str, Any]]:
+    """Parse a raw JSON log line straight into the values hashed for its leaf.
+
+    Equivalent to ``merkle.leaf_parts(LogEntry.parse_raw(raw))`` but skips
+    building the dataclass, for callers that only need the leaf hash.
+    """
+
+    payload = _loads(raw)
+    ts, source_id, level, msg = _required_fields(payload)
+    return format_timestamp(ts), source_id, level, msg, _canonical_fields(payload)
+
+
 @dataclass
 class LogEntry:
     """Normalized log entry expected by the batcher."""
@@ -68,24 +180,17 @@ class LogEntry:
 
     @classmethod
     def parse_obj(cls, payload: Mapping[str, Any]) -> "LogEntry":
-        try:
-            ts = _ensure_datetime(payload["ts"])
-            source_id = str(payload["source_id"])
-            level = str(payload["level"])
-            msg = str(payload["msg"])
-        except KeyError as exc:
-            raise ValueError(f"Missing required field {exc.args[0]}") from exc
-
+        ts, source_id, level, msg = _required_fields(payload)
         fields = _canonical_fields(payload)
         return cls(ts=ts, source_id=source_id, level=level, msg=msg, fields=fields)
 
     @classmethod
-    def parse_raw(cls, raw: str) -> "LogEntry":
-        return cls.parse_obj(json.loads(raw))
+    def parse_raw(cls, raw: str | bytes) -> "LogEntry":
+        return cls.parse_obj(_loads(raw))
 
     def dict(self) -> Dict[str, Any]:
         return {
-            "ts": self.ts.strftime(ISOFORMAT),
+            "ts": format_timestamp(self.ts),
             "source_id": self.source_id,
             "level": self.level,
             "msg": self.msg,
@@ -93,7 +198,7 @@ class LogEntry:
         }
 
     def json(self) -> str:
-        return json.dumps(self.dict(), separators=(",", ":"))
+        return _dumps(self.dict())
 
 
 @dataclass
@@ -118,12 +223,25 @@ class BatchMeta:
         self.prev_merkle_root = _validate_hex32(self.prev_merkle_root)
         self.root = _validate_hex32(self.root)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any field change (e.g. attaching ``sig`` after signing) invalidates
+        # the rendered payload cached by dict()/json().
+        super().__setattr__(name, value)
+        self.__dict__.pop("_rendered", None)
+        self.__dict__.pop("_rendered_json", None)
+
     def dict(self) -> Dict[str, Any]:
+        rendered = self.__dict__.get("_rendered")
+        if rendered is None:
+            rendered = self.__dict__["_rendered"] = self._render()
+        return dict(rendered)
+
+    def _render(self) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
             "batch_id": self.batch_id,
             "count": self.count,
-            "window_start": self.window_start.strftime(ISOFORMAT),
-            "window_end": self.window_end.strftime(ISOFORMAT),
+            "window_start": format_timestamp(self.window_start),
+            "window_end": format_timestamp(self.window_end),
             "hash_alg": self.hash_alg,
             "leaf_order": self.leaf_order,
             "signer_alg": self.signer_alg,
@@ -135,7 +253,10 @@ class BatchMeta:
         return payload
 
     def json(self) -> str:
-        return json.dumps(self.dict(), separators=(",", ":"))
+        rendered_json = self.__dict__.get("_rendered_json")
+        if rendered_json is None:
+            rendered_json = self.__dict__["_rendered_json"] = _dumps(self.dict())
+        return rendered_json
 
 
-__all__ = ["BatchMeta", "LogEntry", "ISOFORMAT"]
+__all__ = ["BatchMeta", "LogEntry", "ISOFORMAT", "format_timestamp", "parse_leaf_parts"]
@@ -8,6 +8,15 @@ import pathlib
 from datetime import datetime
 from typing import Any, Dict
 
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_CLOEXEC", 0)
+
+
+def _encode(payload: Dict[str, Any]) -> bytes:
+    # Evidence records are written once and must keep every value verbatim,
+    # so this stays on the stdlib encoder: orjson would turn NaN/Infinity
+    # into null.
+    return json.dumps(payload, indent=2).encode("utf-8")
+
 
 class AppendOnlyStore:
     """A simple write-once store that appends JSON records to disk."""
@@ -24,11 +33,23 @@ class AppendOnlyStore:
 
         timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
         path = self._path_for(f"{name}.{timestamp}.json")
-        if path.exists():
-            raise FileExistsError(f"Refusing to overwrite existing {path}")
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2)
-        os.chmod(path, 0o440)
+        data = _encode(payload)
+
+        # O_EXCL makes the existence check and the create a single atomic step.
+        try:
+            fd = os.open(path, _CREATE_FLAGS, 0o440)
+        except FileExistsError:
+            raise FileExistsError(f"Refusing to overwrite existing {path}") from None
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, 0o440)
+            else:  # pragma: no cover - Windows has no fchmod
+                os.chmod(path, 0o440)
+        finally:
+            os.close(fd)
         return path
 
 
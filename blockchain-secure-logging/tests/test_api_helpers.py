@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+import os
 import pathlib
 import sys
 
@@ -12,7 +14,12 @@ REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from offchain.api import _bytes32
+from offchain import api, merkle
+from offchain.api import DEFAULT_LOG_ANCHOR_ABI, _bytes32, _load_chain_abi, _manifest_proof
+from offchain.batcher import BatchInputs, build_manifest, persist_manifest
+from offchain.schemas import LogEntry
+
+SAMPLE_LOG_PATH = REPO_ROOT / "tests" / "sample_logs" / "authsvc.jsonl"
 
 
 def test_bytes32_rejects_non_hex_input_with_http_400() -> None:
@@ -21,3 +28,116 @@ def test_bytes32_rejects_non_hex_input_with_http_400() -> None:
 
     assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
     assert "Expected 32-byte hex value" in exc_info.value.detail
+
+
+def test_load_chain_abi_reloads_when_file_changes(tmp_path: pathlib.Path) -> None:
+    abi_path = tmp_path / "LogAnchor.json"
+    abi_path.write_text(json.dumps([{"name": "first"}]), encoding="utf-8")
+    chain_cfg = {"contract_abi_path": str(abi_path)}
+
+    assert _load_chain_abi(chain_cfg) == [{"name": "first"}]
+    assert _load_chain_abi(chain_cfg) is _load_chain_abi(chain_cfg)
+
+    abi_path.write_text(json.dumps([{"name": "second"}]), encoding="utf-8")
+    stat = abi_path.stat()
+    os.utime(abi_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert _load_chain_abi(chain_cfg) == [{"name": "second"}]
+
+    abi_path.unlink()
+    assert _load_chain_abi(chain_cfg) is DEFAULT_LOG_ANCHOR_ABI
+
+
+def _sample_entries() -> list[LogEntry]:
+    return [
+        LogEntry.parse_raw(line)
+        for line in SAMPLE_LOG_PATH.read_text().splitlines()
+        if line.strip()
+    ]
+
+
+def test_prepared_entries_rehash_to_the_same_leaf_with_non_finite_fields() -> None:
+    entry = LogEntry.parse_raw(
+        b'{"ts":"2025-09-23T18:05:00Z","source_id":"authsvc","level":"INFO",'
+        b'"msg":"m","latency":NaN,"ceiling":-Infinity}'
+    )
+    (prepared,) = api._prepare_entries([entry])
+    persisted = json.loads(json.dumps(prepared))
+
+    assert merkle.leaf_hash(LogEntry.parse_obj(persisted)) == merkle.leaf_hash(entry)
+
+
+def test_manifest_proof_uses_persisted_proofs_and_leaves() -> None:
+    entries = _sample_entries()
+    leaves = [merkle.leaf_hash(entry) for entry in entries]
+    manifest = build_manifest("demo", entries, None)
+    leaves_only = {"leaves": manifest["leaves"]}
+
+    for index in range(len(entries)):
+        expected = merkle.merkle_proof(index, leaves)
+        assert _manifest_proof(manifest, index) == expected
+        assert _manifest_proof(leaves_only, index) == expected
+
+
+def test_verify_reuses_cached_result_until_chain_root_changes(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    entries = _sample_entries()
+    manifest = build_manifest("demo", entries, None)
+    manifest["entries"] = [entry.dict() for entry in entries]
+    persist_manifest(manifest, "demo", tmp_path)
+
+    chain_roots = [manifest["batch"]["root"]]
+    leaf_calls: list[LogEntry] = []
+    real_leaf_hash = merkle.leaf_hash
+
+    def counting_leaf_hash(entry: LogEntry) -> bytes:
+        leaf_calls.append(entry)
+        return real_leaf_hash(entry)
+
+    monkeypatch.setattr(api, "_fetch_on_chain_root", lambda config: chain_roots[-1])
+    monkeypatch.setattr(merkle, "leaf_hash", counting_leaf_hash)
+    api._verify_cache.clear()
+    api._chain_root_cache.clear()
+
+    first = api.verify(batch_id="demo", entry_index=1, manifest_dir=str(tmp_path))
+    second = api.verify(batch_id="demo", entry_index=1, manifest_dir=str(tmp_path))
+    assert first.verified and second is first
+    assert len(leaf_calls) == 1
+
+    chain_roots.append("0x" + "ab" * 32)
+    api._chain_root_cache.clear()
+    third = api.verify(batch_id="demo", entry_index=1, manifest_dir=str(tmp_path))
+    assert not third.root_matches_chain
+    assert len(leaf_calls) == 2
+
+
+def test_anchor_batch_invalidates_cached_chain_root(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    entries = _sample_entries()
+    chain_roots: list[str] = []
+
+    def fake_anchor(config, batch_id, manifest, wait_for_receipt):
+        chain_roots.append(manifest["batch"]["root"])
+        return "0x" + "00" * 32, None
+
+    def gather_entries(config):
+        # Each batch drops one more leading entry so the two roots differ.
+        return BatchInputs(entries=entries[len(chain_roots):], prev_root=None)
+
+    config = {"chain": {"rpc_url": "http://127.0.0.1:8545", "contract_address": "0x" + "11" * 20}}
+    monkeypatch.setattr(api, "load_config", lambda path: config)
+    monkeypatch.setattr(api, "gather_entries", gather_entries)
+    monkeypatch.setattr(api, "_anchor_on_chain", fake_anchor)
+    monkeypatch.setattr(api, "_fetch_on_chain_root", lambda config: chain_roots[-1])
+    api._verify_cache.clear()
+    api._chain_root_cache.clear()
+
+    for batch_id in ("batch-a", "batch-b"):
+        anchored = api.anchor_batch(api.AnchorBatchRequest(batch_id=batch_id, manifest_dir=str(tmp_path)))
+        result = api.verify(batch_id=batch_id, entry_index=0, manifest_dir=str(tmp_path))
+        assert result.on_chain_root == anchored.merkle_root
+        assert result.verified
+
+    stale = api.verify(batch_id="batch-a", entry_index=0, manifest_dir=str(tmp_path))
+    assert not stale.root_matches_chain
@@ -0,0 +1,24 @@
+"""Regression tests for the append-only local evidence store."""
+
+from __future__ import annotations
+
+import json
+import math
+import pathlib
+import sys
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from offchain.storage.local_store import AppendOnlyStore
+
+
+def test_append_json_preserves_non_finite_floats(tmp_path: pathlib.Path) -> None:
+    store = AppendOnlyStore(tmp_path)
+    path = store.append_json("evidence", {"latency": math.nan, "ceiling": math.inf, "floor": -math.inf})
+
+    record = json.loads(path.read_text(encoding="utf-8"))
+    assert math.isnan(record["latency"])
+    assert record["ceiling"] == math.inf
+    assert record["floor"] == -math.inf
@@ -6,6 +6,7 @@ fixtures exercise deterministic hashing and tamper detection logic.
 
 from __future__ import annotations
 
+import math
 import pathlib
 
 import sys
@@ -17,8 +18,8 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from offchain import merkle
-from offchain.batcher import build_manifest
-from offchain.schemas import LogEntry
+from offchain.batcher import build_manifest, hash_leaves
+from offchain.schemas import BatchMeta, LogEntry
 
 SAMPLE_LOG_PATH = pathlib.Path(__file__).resolve().parent / "sample_logs" / "authsvc.jsonl"
 EXPECTED_ROOT = "0x5fbcb1b4c120926c62b1dd0550ce8288e7694bedda40740f0bf8480d2dc00dec"
@@ -26,10 +27,11 @@ EXPECTED_ROOT = "0x5fbcb1b4c120926c62b1dd0550ce8288e7694bedda40740f0bf8480d2dc00
 
 def _load_entries() -> list[LogEntry]:
     entries = []
-    for line in SAMPLE_LOG_PATH.read_text().splitlines():
-        if not line.strip():
-            continue
-        entries.append(LogEntry.parse_raw(line))
+    with SAMPLE_LOG_PATH.open("rb") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            entries.append(LogEntry.parse_raw(line))
     return entries
 
 
@@ -39,6 +41,54 @@ def test_log_entry_parsing_merges_dynamic_fields() -> None:
     assert entries[1].fields["user"] == "alice"
 
 
+def test_log_entry_round_trips_integers_wider_than_64_bits() -> None:
+    raw = (
+        b'{"ts":"2025-09-23T18:05:00Z","source_id":"authsvc","level":"INFO",'
+        b'"msg":"m","txn":123456789012345678901234567890}'
+    )
+    entry = LogEntry.parse_raw(raw)
+
+    assert entry.fields["txn"] == 123456789012345678901234567890
+    assert LogEntry.parse_raw(entry.json()) == entry
+
+
+def test_log_entry_round_trips_non_finite_floats() -> None:
+    raw = (
+        b'{"ts":"2025-09-23T18:05:00Z","source_id":"authsvc","level":"INFO",'
+        b'"msg":"m","latency":NaN,"ceiling":Infinity}'
+    )
+    entry = LogEntry.parse_raw(raw)
+    restored = LogEntry.parse_raw(entry.json())
+
+    assert math.isnan(restored.fields["latency"])
+    assert restored.fields["ceiling"] == math.inf
+    assert merkle.leaf_hash(restored) == merkle.leaf_hash(entry)
+
+
+@pytest.mark.parametrize(
+    "root",
+    ["0x" + "g" * 64, "0x0x" + "a" * 62, "0x" + "a" * 62 + "_b", "0x" + "a" * 62 + " b", "0x" + "٣" * 64],
+)
+def test_batch_meta_rejects_non_hex_roots(root: str) -> None:
+    entries = _load_entries()
+    with pytest.raises(ValueError, match="hexadecimal"):
+        BatchMeta(batch_id="demo", count=1, window_start=entries[0].ts, window_end=entries[0].ts, root=root)
+
+
+def test_batch_meta_rendering_tracks_field_updates() -> None:
+    entries = _load_entries()
+    meta = BatchMeta(batch_id="demo", count=1, window_start=entries[0].ts, window_end=entries[0].ts)
+
+    first = meta.dict()
+    first["sig"] = "mutated by caller"
+    assert meta.dict()["sig"] is None
+    assert meta.json() is meta.json()
+
+    meta.sig = "0xsigned"
+    assert meta.dict()["sig"] == "0xsigned"
+    assert '"sig":"0xsigned"' in meta.json()
+
+
 def test_canonical_leaf_rejects_reserved_field_overrides() -> None:
     entries = _load_entries()
     malicious = LogEntry(
@@ -60,6 +110,40 @@ def test_merkle_root_matches_known_value() -> None:
     assert "0x" + root.hex() == EXPECTED_ROOT
 
 
+def test_leaf_hashes_matches_per_entry_hashing() -> None:
+    entries = _load_entries()
+    assert merkle.leaf_hashes(entries) == [merkle.leaf_hash(entry) for entry in entries]
+
+
+def test_leaf_hash_from_raw_matches_parsed_entries() -> None:
+    lines = [line for line in SAMPLE_LOG_PATH.read_bytes().splitlines() if line.strip()]
+    lines.append(b'{"ts":1695492300,"source_id":7,"level":"INFO","msg":"numeric","fields":{"a":1},"b":2}')
+
+    for line in lines:
+        assert merkle.leaf_hash_from_raw(line) == merkle.leaf_hash(LogEntry.parse_raw(line))
+
+
+def test_fields_accept_key_value_pairs() -> None:
+    entry = LogEntry.parse_raw(
+        b'{"ts":"2025-09-23T18:05:00Z","source_id":"authsvc","level":"INFO","msg":"m","fields":[["k",1]],"b":2}'
+    )
+    assert entry.fields == {"k": 1, "b": 2}
+
+
+def test_leaf_hash_keeps_strftime_timestamp_rendering() -> None:
+    # Pinned to the digest produced when timestamps went through strftime,
+    # which leaves years before 1000 unpadded.
+    entry = LogEntry.parse_raw(b'{"ts":"0999-01-02T03:04:05Z","source_id":"authsvc","level":"INFO","msg":"m"}')
+    assert entry.dict()["ts"] == "999-01-02T03:04:05Z"
+    assert merkle.leaf_hash(entry).hex() == "318ac70d66369330da81de9b82b9822c0e7b2b7922d4faea6c414a6d0809d1c6"
+
+
+def test_parallel_leaf_hashing_preserves_order() -> None:
+    entries = _load_entries() * 5
+    serial = merkle.leaf_hashes(entries)
+    assert hash_leaves(entries, parallel_threshold=1, max_workers=2) == serial
+
+
 def test_merkle_proof_detects_tampering() -> None:
     entries = _load_entries()
     leaves = [merkle.leaf_hash(entry) for entry in entries]
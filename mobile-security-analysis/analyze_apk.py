@@ -5,16 +5,49 @@ Automates chained analysis tasks for Android APKs and iOS IPAs."""
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
+import inspect
 import json
+import math
+import os
 import plistlib
+import re
 import shutil
-import subprocess
+import stat
+import sys
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
 from xml.etree import ElementTree as ET
-from zipfile import ZipFile
+from xml.parsers.expat import ExpatError
+from zipfile import BadZipFile, ZipFile, ZipInfo
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+EXTRACT_CHUNK_SIZE = 64 * 1024
+TOOL_OUTPUT_CHUNK_SIZE = 64 * 1024
+TOOL_OUTPUT_LINE_LIMIT = 1024 * 1024
+FINDINGS_REPORT_NAME = "findings_report.ndjson"
+FINDINGS_SUMMARY_NAME = "findings_summary.json"
+INFO_PLIST_PATTERN = re.compile(r"Payload/[^/]+\.app/Info\.plist")
+IOS_APP_DIR_PATTERN = re.compile(r"Payload/([^/]+\.app)/")
+
+URL_SCHEME_REFERENCE = (
+    "https://developer.apple.com/documentation/xcode/defining-a-custom-url-scheme-for-your-app"
+)
+ATS_REFERENCE = (
+    "https://developer.apple.com/documentation/bundleresources/information_property_list/nsapptransportsecurity"
+)
+
+
+def log(message: str, label: Optional[str] = None) -> None:
+    print(f"[{label}] {message}" if label else message)
 
 
 @dataclass
@@ -23,8 +56,18 @@ class AnalysisContext:
 
     target_path: Path
     output_dir: Path
-    data: Dict[str, object] = field(default_factory=dict)
-    findings: List["Finding"] = field(default_factory=list)
+    extract_payload: bool = False
+    log_label: Optional[str] = None
+    severity_counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def findings_path(self) -> Path:
+        return self.output_dir / FINDINGS_REPORT_NAME
+
+    def log(self, message: str) -> None:
+        """Print a status line, prefixed with ``log_label`` in batch mode."""
+
+        log(message, self.log_label)
 
 
 @dataclass
@@ -40,102 +83,189 @@ class Finding:
 
 
 def record_finding(context: AnalysisContext, finding: Finding) -> None:
-    """Add a structured finding to the analysis context."""
+    """Append a structured finding to the run's NDJSON report.
+
+    Findings are written as they are recorded rather than held until the
+    end of the run; only the per-severity counts stay in memory.
+    """
 
-    context.findings.append(finding)
+    with context.findings_path.open("ab") as handle:
+        handle.write(dump_json_line(asdict(finding)))
+    context.severity_counts[finding.severity] = context.severity_counts.get(finding.severity, 0) + 1
 
 
 @dataclass
 class AnalysisTask:
     name: str
     description: str
-    runner: Callable[[AnalysisContext, Path], int]
-
-
-def run_tool(command: List[str], cwd: Optional[Path] = None) -> int:
-    """Run an external command and stream its output."""
-    result = subprocess.run(command, cwd=cwd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"[!] Command failed: {' '.join(command)}")
-        if result.stderr:
-            print(result.stderr)
-    else:
-        if result.stdout:
-            print(result.stdout)
-    return result.returncode
+    runner: Callable[[AnalysisContext, Path], Union[int, Awaitable[int]]]
+    requires: Tuple[str, ...] = ()
+
+
+async def run_tool(command: List[str], cwd: Optional[Path] = None, label: Optional[str] = None) -> int:
+    """Run an external command and stream its output line by line.
+
+    stderr is merged into stdout and each line is prefixed with the tool name
+    (and ``label``, the target name in batch mode) so output from concurrently
+    running tools stays attributable, without buffering a whole run's logs in
+    memory. Lines longer than :data:`TOOL_OUTPUT_LINE_LIMIT` are written in
+    pieces rather than failing the run. If the caller is cancelled or output
+    handling raises, the child is killed instead of being left running.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *command,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    tool = Path(command[0]).name
+    prefix = f"[{label}:{tool}] " if label else f"[{tool}] "
 
+    def emit(line: bytes) -> None:
+        sys.stdout.write(prefix + line.decode(errors="replace").rstrip("\r\n") + "\n")
 
-def ensure_tool_installed(tool_name: str) -> bool:
-    if shutil.which(tool_name) is None:
-        print(f"[!] {tool_name} not found. Please install it first.")
+    assert proc.stdout is not None
+    try:
+        pending = b""
+        while chunk := await proc.stdout.read(TOOL_OUTPUT_CHUNK_SIZE):
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                emit(line)
+            while len(pending) > TOOL_OUTPUT_LINE_LIMIT:
+                emit(pending[:TOOL_OUTPUT_LINE_LIMIT])
+                pending = pending[TOOL_OUTPUT_LINE_LIMIT:]
+        if pending:
+            emit(pending)
+        returncode = await proc.wait()
+    except BaseException:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+    if returncode != 0:
+        log(f"[!] Command failed: {' '.join(command)}", label)
+    return returncode
+
+
+@functools.lru_cache(maxsize=None)
+def _tool_path(tool_name: str) -> Optional[str]:
+    # PATH does not change during a run, so each tool is looked up once even
+    # when --batch runs the same runners for many targets.
+    return shutil.which(tool_name)
+
+
+def ensure_tool_installed(context: AnalysisContext, tool_name: str) -> bool:
+    if _tool_path(tool_name) is None:
+        context.log(f"[!] {tool_name} not found. Please install it first.")
         return False
     return True
 
 
-def save_findings_report(context: AnalysisContext) -> None:
-    """Persist taxonomy-aware findings and severity tags to disk."""
+def _has_non_finite(value: object) -> bool:
+    """Return True if ``value`` holds a NaN or infinite float at any depth."""
+
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+def dump_json(payload: object) -> bytes:
+    """Encode ``payload`` as indented JSON, preferring orjson when installed.
+
+    orjson writes NaN and Infinity (possible in plist <real> values) as null
+    without raising, so those payloads go to :mod:`json` up front; orjson's
+    own error on integers wider than 64 bits falls back the same way.
+    """
+
+    if orjson is not None and not _has_non_finite(payload):
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def dump_json_line(payload: object) -> bytes:
+    """Encode ``payload`` as one compact, newline-terminated NDJSON record."""
 
-    report_path = context.output_dir / "findings_report.json"
-    findings_data = [asdict(finding) for finding in context.findings]
-    severity_counts: Dict[str, int] = {}
-    for finding in context.findings:
-        severity_counts[finding.severity] = severity_counts.get(finding.severity, 0) + 1
+    if orjson is not None and not _has_non_finite(payload):
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass
+    return (json.dumps(payload) + "\n").encode("utf-8")
 
-    report_path.write_text(
-        json.dumps(
+
+def reset_findings_report(context: AnalysisContext) -> None:
+    """Start an empty findings report, discarding any from a previous run."""
+
+    context.findings_path.write_bytes(b"")
+    context.severity_counts.clear()
+
+
+def save_findings_report(context: AnalysisContext) -> None:
+    """Persist the findings summary (counts and severity tags) next to the report."""
+
+    summary_path = context.output_dir / FINDINGS_SUMMARY_NAME
+    summary_path.write_bytes(
+        dump_json(
             {
-                "summary": {
-                    "total_findings": len(findings_data),
-                    "severity_breakdown": severity_counts,
-                },
-                "findings": findings_data,
-            },
-            indent=2,
+                "total_findings": sum(context.severity_counts.values()),
+                "severity_breakdown": context.severity_counts,
+                "findings_report": FINDINGS_REPORT_NAME,
+            }
         )
     )
-    print(f"[*] Saved findings report to {report_path}")
+    context.log(f"[*] Saved findings report to {context.findings_path} (summary: {summary_path})")
 
 
 # --- Android task implementations --------------------------------------------------
 
-def decompile_with_apktool(context: AnalysisContext, task_out: Path) -> int:
-    if not ensure_tool_installed("apktool"):
+async def decompile_with_apktool(context: AnalysisContext, task_out: Path) -> int:
+    if not ensure_tool_installed(context, "apktool"):
         return 1
-    task_out.mkdir(parents=True, exist_ok=True)
-    return run_tool(["apktool", "d", "-f", str(context.target_path), "-o", str(task_out)])
+    return await run_tool(
+        ["apktool", "d", "-f", str(context.target_path), "-o", str(task_out)], label=context.log_label
+    )
 
 
-def jadx_decompile(context: AnalysisContext, task_out: Path) -> int:
-    if not ensure_tool_installed("jadx"):
+async def jadx_decompile(context: AnalysisContext, task_out: Path) -> int:
+    if not ensure_tool_installed(context, "jadx"):
         return 1
-    task_out.mkdir(parents=True, exist_ok=True)
-    return run_tool(["jadx", str(context.target_path), "-d", str(task_out)])
-
+    return await run_tool(["jadx", str(context.target_path), "-d", str(task_out)], label=context.log_label)
 
-def derive_android_package_name(context: AnalysisContext) -> Optional[str]:
-    if "android_package" in context.data:
-        return context.data["android_package"]  # type: ignore[return-value]
-
-    manifest_path = context.output_dir / "apktool" / "AndroidManifest.xml"
-    if not manifest_path.exists():
-        return None
 
+@functools.lru_cache(maxsize=128)
+def _read_android_package_name(manifest_path: Path, mtime_ns: int) -> Optional[str]:
+    # ``mtime_ns`` only keys the cache so a re-decompiled manifest is re-read.
+    # Only the root <manifest> element is needed, so parsing stops at the first
+    # start event instead of building the whole (possibly merged) document.
     try:
-        tree = ET.parse(manifest_path)
-        package_name = tree.getroot().attrib.get("package")
+        with manifest_path.open("rb") as handle:
+            for _event, root in ET.iterparse(handle, events=("start",)):
+                return root.attrib.get("package")
     except ET.ParseError:
-        package_name = None
+        pass
+    return None
+
 
-    if package_name:
-        context.data["android_package"] = package_name
-    return package_name
+def derive_android_package_name(context: AnalysisContext) -> Optional[str]:
+    manifest_path = context.output_dir / "apktool" / "AndroidManifest.xml"
+    try:
+        mtime_ns = manifest_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _read_android_package_name(manifest_path, mtime_ns)
 
 
 def generate_frida_helper(context: AnalysisContext, task_out: Path) -> int:
-    if not ensure_tool_installed("frida"):
+    if not ensure_tool_installed(context, "frida"):
         return 1
 
-    task_out.mkdir(parents=True, exist_ok=True)
     package_name = derive_android_package_name(context) or "<replace.with.package>"
 
     script_content = textwrap.dedent(
@@ -163,7 +293,7 @@ def generate_frida_helper(context: AnalysisContext, task_out: Path) -> int:
     (task_out / "frida_hook_template.js").write_text(script_content)
     (task_out / "frida_commands.txt").write_text(command_snippet)
 
-    print("[*] Generated Frida helper artifacts (script template and usage notes)")
+    context.log("[*] Generated Frida helper artifacts (script template and usage notes)")
     return 0
 
 
@@ -182,60 +312,133 @@ ANDROID_TASKS: List[AnalysisTask] = [
         name="frida_helper",
         description="Generating Frida instrumentation helpers",
         runner=generate_frida_helper,
+        requires=("apktool",),
     ),
 ]
 
 
 # --- iOS task helpers --------------------------------------------------------------
 
-def _find_ios_app_dir(extract_dir: Path) -> Optional[Path]:
-    payload_dir = extract_dir / "Payload"
-    if not payload_dir.exists():
-        return None
-    apps = sorted(payload_dir.glob("*.app"))
+def _member_destination(root: Path, name: str) -> Optional[Path]:
+    """Map an archive member to a path under ``root``.
+
+    Mirrors ``ZipFile.extract`` by dropping empty, ``.`` and ``..`` components
+    so crafted member names cannot escape the output directory.
+    """
+
+    parts = [part for part in name.replace(os.sep, "/").split("/") if part not in ("", ".", "..")]
+    return root.joinpath(*parts) if parts else None
+
+
+def _is_symlink(info: ZipInfo) -> bool:
+    # Unix mode bits live in the high 16 bits of external_attr.
+    return stat.S_ISLNK(info.external_attr >> 16)
+
+
+def _extract_members(archive: Path, root: Path, members: List[ZipInfo]) -> None:
+    # ZipFile handles are not safe to share across threads, so each worker
+    # opens its own.
+    with ZipFile(archive) as zf:
+        for info in members:
+            destination = _member_destination(root, info.filename)
+            if destination is None:
+                continue
+            with zf.open(info) as src, open(destination, "wb") as dst:
+                shutil.copyfileobj(src, dst, EXTRACT_CHUNK_SIZE)
+
+
+def extract_archive(archive: Path, root: Path, max_workers: Optional[int] = None) -> None:
+    """Extract ``archive`` into ``root`` using a pool of reader threads."""
+
+    # Directory records are implied by the parents created below, and symlink
+    # records would only be written out as small files holding the link
+    # target, so both are dropped before any worker runs.
+    with ZipFile(archive) as zf:
+        members = [info for info in zf.infolist() if not (info.is_dir() or _is_symlink(info))]
+
+    # Create every parent directory once up front so workers only write files.
+    parents = set()
+    for info in members:
+        destination = _member_destination(root, info.filename)
+        if destination is not None:
+            parents.add(destination.parent)
+    for directory in sorted(parents):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(members)))
+    # Round-robin slices spread large and small members evenly across workers.
+    slices = [members[index::workers] for index in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(lambda chunk: _extract_members(archive, root, chunk), slices):
+            pass
+
+
+@functools.lru_cache(maxsize=128)
+def _read_ios_app_name(target_path: Path, mtime_ns: int) -> Optional[str]:
+    """Return the ``Payload/*.app`` bundle name listed in the IPA, if any.
+
+    Matches on member prefixes rather than directory entries, since not every
+    packager writes explicit directory records into the archive.
+    """
+
+    with ZipFile(target_path) as ipa:
+        apps = sorted(
+            {match.group(1) for match in map(IOS_APP_DIR_PATTERN.match, ipa.namelist()) if match}
+        )
     return apps[0] if apps else None
 
 
-def _load_info_plist(context: AnalysisContext) -> Optional[dict]:
-    if "ios_info_plist" in context.data:
-        return context.data["ios_info_plist"]  # type: ignore[return-value]
+@functools.lru_cache(maxsize=128)
+def _read_info_plist(target_path: Path, mtime_ns: int) -> dict:
+    """Parse the app bundle's Info.plist; cached per IPA path and mtime.
 
-    app_dir = context.data.get("ios_app_dir")
-    if not isinstance(app_dir, Path):
-        print("[!] Unable to locate Payload/*.app directory. Extract step may have failed.")
-        return None
+    The plist is read straight out of the archive via the central directory,
+    so none of the metadata tasks need the payload extracted to disk. Callers
+    share the returned dictionary and must not modify it. Failures raise and
+    are therefore not cached.
+    """
 
-    plist_path = app_dir / "Info.plist"
-    if not plist_path.exists():
-        print("[!] Info.plist not found in extracted app bundle.")
-        return None
+    with ZipFile(target_path) as ipa:
+        members = sorted(name for name in ipa.namelist() if INFO_PLIST_PATTERN.fullmatch(name))
+        if not members:
+            raise FileNotFoundError("Info.plist not found under Payload/*.app in the IPA.")
+        return plistlib.loads(ipa.read(members[0]))
 
-    with plist_path.open("rb") as plist_file:
-        info = plistlib.load(plist_file)
 
-    context.data["ios_info_plist"] = info
-    return info
+def _load_info_plist(context: AnalysisContext) -> Optional[dict]:
+    target_path = context.target_path
+    try:
+        return _read_info_plist(target_path, target_path.stat().st_mtime_ns)
+    except FileNotFoundError as exc:
+        context.log(f"[!] {exc}")
+    except (BadZipFile, plistlib.InvalidFileException, ExpatError) as exc:
+        context.log(f"[!] Unable to read Info.plist from IPA: {exc}")
+    return None
 
 
 # --- iOS task implementations ------------------------------------------------------
 
-def extract_ios_payload(context: AnalysisContext, task_out: Path) -> int:
-    task_out.mkdir(parents=True, exist_ok=True)
+async def extract_ios_payload(context: AnalysisContext, task_out: Path) -> int:
+    if not context.extract_payload:
+        context.log("[*] Skipping payload extraction; pass --extract to write it to disk.")
+        return 0
+
+    target_path = context.target_path
     try:
-        with ZipFile(context.target_path) as ipa:
-            ipa.extractall(task_out)
+        # The bundle name comes from the central directory, so a payload
+        # without one fails before anything is written to disk.
+        app_name = _read_ios_app_name(target_path, target_path.stat().st_mtime_ns)
+        if app_name is None:
+            context.log("[!] Could not locate Payload/*.app in the IPA.")
+            return 1
+        # Extraction runs off the event loop so other targets' pipelines in
+        # --batch mode keep making progress meanwhile.
+        await asyncio.to_thread(extract_archive, target_path, task_out)
     except Exception as exc:  # pragma: no cover - informative logging
-        print(f"[!] Failed to extract IPA: {exc}")
-        return 1
-
-    app_dir = _find_ios_app_dir(task_out)
-    if app_dir:
-        context.data["ios_app_dir"] = app_dir
-        print(f"[*] Located iOS app bundle: {app_dir}")
-    else:
-        print("[!] Could not locate Payload/*.app after extraction.")
+        context.log(f"[!] Failed to extract IPA: {exc}")
         return 1
 
+    context.log(f"[*] Located iOS app bundle: {task_out / 'Payload' / app_name}")
     return 0
 
 
@@ -252,10 +455,9 @@ def summarize_ios_metadata(context: AnalysisContext, task_out: Path) -> int:
         "ats_configuration": info.get("NSAppTransportSecurity", {}),
     }
 
-    task_out.mkdir(parents=True, exist_ok=True)
     summary_path = task_out / "info_plist_summary.json"
-    summary_path.write_text(json.dumps(summary, indent=2))
-    print(f"[*] Saved Info.plist summary to {summary_path}")
+    summary_path.write_bytes(dump_json(summary))
+    context.log(f"[*] Saved Info.plist summary to {summary_path}")
     return 0
 
 
@@ -264,17 +466,16 @@ def enumerate_ios_url_schemes(context: AnalysisContext, task_out: Path) -> int:
     if info is None:
         return 1
 
-    url_types = info.get("CFBundleURLTypes", []) or []
-    schemes: List[str] = []
-    for entry in url_types:
-        entry_schemes = entry.get("CFBundleURLSchemes") or []
-        schemes.extend(entry_schemes)
+    schemes: List[str] = [
+        scheme
+        for entry in info.get("CFBundleURLTypes") or ()
+        for scheme in entry.get("CFBundleURLSchemes") or ()
+    ]
 
-    task_out.mkdir(parents=True, exist_ok=True)
     output_path = task_out / "url_schemes.txt"
+    output_path.write_text("\n".join(schemes) if schemes else "<no custom URL schemes declared>")
     if schemes:
-        output_path.write_text("\n".join(schemes))
-        print(f"[*] Enumerated URL schemes: {', '.join(schemes)}")
+        context.log(f"[*] Enumerated URL schemes: {', '.join(schemes)}")
         record_finding(
             context,
             Finding(
@@ -287,14 +488,11 @@ def enumerate_ios_url_schemes(context: AnalysisContext, task_out: Path) -> int:
                 ),
                 taxonomy=["ios", "url_scheme", "surface"],
                 severity="informational",
-                references=[
-                    "https://developer.apple.com/documentation/xcode/defining-a-custom-url-scheme-for-your-app"
-                ],
+                references=[URL_SCHEME_REFERENCE],
             ),
         )
     else:
-        output_path.write_text("<no custom URL schemes declared>")
-        print("[*] No custom URL schemes declared in Info.plist")
+        context.log("[*] No custom URL schemes declared in Info.plist")
 
     return 0
 
@@ -309,13 +507,12 @@ def analyze_ios_transport_security(context: AnalysisContext, task_out: Path) ->
         "allows_arbitrary_loads": ats.get("NSAllowsArbitraryLoads", False),
         "allows_http_loads": ats.get("NSAllowsArbitraryLoadsInWebContent", False)
         or ats.get("NSAllowsLocalNetworking", False),
-        "exception_domains": list((ats.get("NSExceptionDomains") or {}).keys()),
+        "exception_domains": [*(ats.get("NSExceptionDomains") or ())],
     }
 
-    task_out.mkdir(parents=True, exist_ok=True)
     report_path = task_out / "ats_report.json"
-    report_path.write_text(json.dumps(report, indent=2))
-    print(f"[*] Saved ATS report to {report_path}")
+    report_path.write_bytes(dump_json(report))
+    context.log(f"[*] Saved ATS report to {report_path}")
 
     if report["allows_arbitrary_loads"]:
         record_finding(
@@ -329,9 +526,7 @@ def analyze_ios_transport_security(context: AnalysisContext, task_out: Path) ->
                 ),
                 taxonomy=["ios", "transport_security", "ats"],
                 severity="high",
-                references=[
-                    "https://developer.apple.com/documentation/bundleresources/information_property_list/nsapptransportsecurity"
-                ],
+                references=[ATS_REFERENCE],
             ),
         )
 
@@ -348,9 +543,7 @@ def analyze_ios_transport_security(context: AnalysisContext, task_out: Path) ->
                 ),
                 taxonomy=["ios", "transport_security", "http"],
                 severity="medium",
-                references=[
-                    "https://developer.apple.com/documentation/bundleresources/information_property_list/nsapptransportsecurity"
-                ],
+                references=[ATS_REFERENCE],
             ),
         )
 
@@ -373,10 +566,9 @@ def analyze_ios_transport_security(context: AnalysisContext, task_out: Path) ->
 
 
 def generate_lldb_helper(context: AnalysisContext, task_out: Path) -> int:
-    if not ensure_tool_installed("lldb"):
+    if not ensure_tool_installed(context, "lldb"):
         return 1
 
-    task_out.mkdir(parents=True, exist_ok=True)
     info = _load_info_plist(context)
     executable = None
     bundle_identifier = None
@@ -412,7 +604,7 @@ def generate_lldb_helper(context: AnalysisContext, task_out: Path) -> int:
 
     (task_out / "lldb_commands.txt").write_text(lldb_commands)
     (task_out / "helper_notes.txt").write_text(tips)
-    print("[*] Generated LLDB helper commands for dynamic instrumentation")
+    context.log("[*] Generated LLDB helper commands for dynamic instrumentation")
     return 0
 
 
@@ -451,6 +643,49 @@ PLATFORM_TASKS = {
 }
 
 
+def task_levels(tasks: List[AnalysisTask]) -> List[List[AnalysisTask]]:
+    """Group ``tasks`` into dependency levels using Kahn's algorithm.
+
+    Every task in a level depends only on tasks in earlier levels, so a level
+    can run concurrently. Declaration order is kept within each level.
+    """
+
+    by_name = {task.name: task for task in tasks}
+    order = {task.name: index for index, task in enumerate(tasks)}
+    pending = {task.name: len(task.requires) for task in tasks}
+    dependents: Dict[str, List[str]] = {task.name: [] for task in tasks}
+    for task in tasks:
+        for requirement in task.requires:
+            if requirement not in by_name:
+                raise ValueError(f"Task '{task.name}' requires unknown task '{requirement}'")
+            dependents[requirement].append(task.name)
+
+    levels: List[List[AnalysisTask]] = []
+    ready = [task.name for task in tasks if not task.requires]
+    while ready:
+        levels.append([by_name[name] for name in ready])
+        next_ready = []
+        for name in ready:
+            for dependent in dependents[name]:
+                pending[dependent] -= 1
+                if not pending[dependent]:
+                    next_ready.append(dependent)
+        ready = sorted(next_ready, key=order.__getitem__)
+
+    if sum(len(level) for level in levels) != len(tasks):
+        cyclic = sorted(name for name, count in pending.items() if count)
+        raise ValueError(f"Task dependencies form a cycle: {', '.join(cyclic)}")
+    return levels
+
+
+# Android: apktool and jadx run together, then the Frida helper reads
+# apktool's manifest. iOS tasks read Info.plist from the archive itself, so
+# none of them wait on extraction and they form a single level.
+PLATFORM_LEVELS: Dict[str, List[List[AnalysisTask]]] = {
+    platform: task_levels(tasks) for platform, tasks in PLATFORM_TASKS.items()
+}
+
+
 def detect_platform(app_path: Path) -> Optional[str]:
     suffix = app_path.suffix.lower()
     if suffix == ".apk":
@@ -460,24 +695,104 @@ def detect_platform(app_path: Path) -> Optional[str]:
     return None
 
 
-def run_pipeline(platform: str, context: AnalysisContext) -> None:
-    tasks = PLATFORM_TASKS[platform]
-    for task in tasks:
-        print(f"[*] {task.description} ({task.name})")
-        task_output_dir = context.output_dir / task.name
-        result = task.runner(context, task_output_dir)
-        if result != 0:
-            print(f"[!] Task '{task.name}' failed. Review logs before proceeding.")
-        else:
-            print(f"[+] Task '{task.name}' completed successfully.\n")
+async def _run_task(task: AnalysisTask, context: AnalysisContext) -> int:
+    context.log(f"[*] {task.description} ({task.name})")
+    task_output_dir = context.output_dir / task.name
+    task_output_dir.mkdir(parents=True, exist_ok=True)
+    result = task.runner(context, task_output_dir)
+    if inspect.isawaitable(result):
+        result = await result
+    if result != 0:
+        context.log(f"[!] Task '{task.name}' failed. Review logs before proceeding.")
+    else:
+        context.log(f"[+] Task '{task.name}' completed successfully.\n")
+    return result
+
+
+async def run_pipeline_async(platform: str, context: AnalysisContext) -> None:
+    reset_findings_report(context)
+    failed: Set[str] = set()
+    for level in PLATFORM_LEVELS[platform]:
+        runnable: List[AnalysisTask] = []
+        for task in level:
+            blocked = [name for name in task.requires if name in failed]
+            if blocked:
+                # Skipped tasks count as failed so their own dependents skip too.
+                context.log(f"[!] Skipping task '{task.name}': required task(s) {', '.join(blocked)} failed.")
+                failed.add(task.name)
+            else:
+                runnable.append(task)
+        pending = [asyncio.ensure_future(_run_task(task, context)) for task in runnable]
+        try:
+            results = await asyncio.gather(*pending)
+        except BaseException:
+            # gather() leaves the other tasks running; cancel them so their
+            # tool processes are killed rather than outliving the pipeline.
+            for future in pending:
+                future.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
+        failed.update(task.name for task, result in zip(runnable, results) if result != 0)
     save_findings_report(context)
 
 
+def run_pipeline(platform: str, context: AnalysisContext) -> None:
+    asyncio.run(run_pipeline_async(platform, context))
+
+
+def collect_batch_targets(batch_dir: Path, platform: str = "auto") -> List[Tuple[Path, str]]:
+    """List the APKs/IPAs in ``batch_dir`` with their detected platforms."""
+
+    targets: List[Tuple[Path, str]] = []
+    for path in sorted(batch_dir.iterdir()):
+        detected = detect_platform(path) if path.is_file() else None
+        if detected is not None and platform in ("auto", detected):
+            targets.append((path, detected))
+    return targets
+
+
+async def run_batch_async(
+    targets: List[Tuple[Path, str]],
+    output_root: Path,
+    extract_payload: bool = False,
+    max_concurrency: Optional[int] = None,
+) -> List[Path]:
+    """Analyze many targets concurrently, each into ``output_root/<file name>``.
+
+    Pipelines share no state beyond their own output directories; the
+    semaphore only bounds how many run (and launch JVM tools) at once.
+    Returns the targets whose pipeline raised and was abandoned.
+    """
+
+    semaphore = asyncio.Semaphore(max_concurrency or os.cpu_count() or 1)
+
+    async def analyze(target_path: Path, platform: str) -> bool:
+        async with semaphore:
+            context = AnalysisContext(
+                target_path=target_path,
+                output_dir=output_root / target_path.name,
+                extract_payload=extract_payload,
+                log_label=target_path.name,
+            )
+            print(f"[*] Starting {platform} analysis pipeline for {target_path}")
+            # One malformed sample must not abort the rest of the batch.
+            try:
+                context.output_dir.mkdir(parents=True, exist_ok=True)
+                await run_pipeline_async(platform, context)
+            except Exception as exc:
+                print(f"[!] Analysis of {target_path} aborted: {exc!r}")
+                return False
+            return True
+
+    results = await asyncio.gather(*(analyze(target_path, platform) for target_path, platform in targets))
+    return [target_path for (target_path, _), ok in zip(targets, results) if not ok]
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Static mobile app analysis with chained tasks for Android and iOS",
     )
-    parser.add_argument("app", help="Path to the target APK or IPA file")
+    parser.add_argument("app", nargs="?", help="Path to the target APK or IPA file")
     parser.add_argument(
         "--out", default="analysis_output", help="Directory to store results"
     )
@@ -487,12 +802,48 @@ def parse_args() -> argparse.Namespace:
         default="auto",
         help="Platform of the target. Defaults to auto-detection based on the file extension.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--extract",
+        action="store_true",
+        help="Extract the full IPA payload to disk. iOS metadata tasks read the archive directly.",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="DIR",
+        help="Analyze every APK/IPA in DIR concurrently instead of a single target.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Maximum number of targets analyzed at once in --batch mode (default: CPU count).",
+    )
+    args = parser.parse_args()
+    if (args.app is None) == (args.batch is None):
+        parser.error("provide either a target file or --batch DIR")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
 
 
 def main() -> None:
     args = parse_args()
 
+    if args.batch is not None:
+        batch_dir = Path(args.batch).resolve()
+        if not batch_dir.is_dir():
+            raise SystemExit(f"[!] Batch directory does not exist: {batch_dir}")
+        targets = collect_batch_targets(batch_dir, args.platform)
+        if not targets:
+            raise SystemExit(f"[!] No APK or IPA files found in {batch_dir}")
+        print(f"[*] Analyzing {len(targets)} targets from {batch_dir} ({args.jobs} at a time)")
+        aborted = asyncio.run(run_batch_async(targets, Path(args.out).resolve(), args.extract, args.jobs))
+        if aborted:
+            names = ", ".join(target_path.name for target_path in aborted)
+            raise SystemExit(f"[!] Analysis aborted for {len(aborted)} of {len(targets)} targets: {names}")
+        print("[*] Analysis complete.")
+        return
+
     target_path = Path(args.app).resolve()
     if not target_path.exists():
         raise SystemExit(f"[!] Target file does not exist: {target_path}")
@@ -507,6 +858,7 @@ def main() -> None:
     context = AnalysisContext(
         target_path=target_path,
         output_dir=Path(args.out).resolve(),
+        extract_payload=args.extract,
     )
     context.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -0,0 +1,91 @@
+"""Regression tests for IPA extraction, tool output and task scheduling."""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import stat
+import sys
+import zipfile
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from analyze_apk import TOOL_OUTPUT_LINE_LIMIT, AnalysisTask, extract_archive, run_tool, task_levels
+
+
+def _noop(context, task_out):  # pragma: no cover - never invoked
+    return 0
+
+
+def test_extract_archive_keeps_members_under_root_and_skips_symlinks(tmp_path: pathlib.Path) -> None:
+    archive = tmp_path / "sample.ipa"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("Payload/App.app/Info.plist", b"plist")
+        zf.writestr("../../escaped.txt", b"traversal")
+        zf.writestr("/absolute/abs.txt", b"absolute")
+        zf.writestr("Payload/App.app/Resources/", b"")
+        link = zipfile.ZipInfo("Payload/App.app/link")
+        link.external_attr = (stat.S_IFLNK | 0o777) << 16
+        zf.writestr(link, "../../../../etc/passwd")
+
+    root = tmp_path / "out"
+    extract_archive(archive, root, max_workers=2)
+
+    extracted = sorted(path for path in tmp_path.rglob("*") if path.is_file() and path != archive)
+    assert all(root in path.parents for path in extracted)
+    assert {path.relative_to(root).as_posix() for path in extracted} == {
+        "Payload/App.app/Info.plist",
+        "escaped.txt",
+        "absolute/abs.txt",
+    }
+    assert (root / "escaped.txt").read_bytes() == b"traversal"
+    assert not (root / "Payload" / "App.app" / "link").exists()
+    assert not (root / "Payload" / "App.app" / "link").is_symlink()
+
+
+def test_task_levels_groups_independent_tasks() -> None:
+    tasks = [
+        AnalysisTask("report", "", _noop, requires=("decode", "decompile")),
+        AnalysisTask("decode", "", _noop),
+        AnalysisTask("decompile", "", _noop, requires=("decode",)),
+        AnalysisTask("helper", "", _noop),
+    ]
+
+    levels = [[task.name for task in level] for level in task_levels(tasks)]
+
+    assert levels == [["decode", "helper"], ["decompile"], ["report"]]
+
+
+def test_task_levels_rejects_unknown_dependencies() -> None:
+    tasks = [AnalysisTask("frida_helper", "", _noop, requires=("apktool",))]
+
+    with pytest.raises(ValueError, match="unknown task 'apktool'"):
+        task_levels(tasks)
+
+
+def test_task_levels_rejects_cycles() -> None:
+    tasks = [
+        AnalysisTask("a", "", _noop, requires=("c",)),
+        AnalysisTask("b", "", _noop, requires=("a",)),
+        AnalysisTask("c", "", _noop, requires=("b",)),
+        AnalysisTask("d", "", _noop),
+    ]
+
+    with pytest.raises(ValueError, match="cycle: a, b, c"):
+        task_levels(tasks)
+
+
+def test_run_tool_streams_lines_longer_than_the_line_limit(capsys: pytest.CaptureFixture[str]) -> None:
+    script = f"import sys; sys.stdout.write('x' * {TOOL_OUTPUT_LINE_LIMIT * 2 + 10} + '\\nlast')"
+
+    assert asyncio.run(run_tool([sys.executable, "-c", script], label="app.apk")) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    prefix = f"[app.apk:{pathlib.Path(sys.executable).name}] "
+    assert all(line.startswith(prefix) for line in lines)
+    assert "".join(line[len(prefix):] for line in lines[:-1]) == "x" * (TOOL_OUTPUT_LINE_LIMIT * 2 + 10)
+    assert lines[-1] == prefix + "last"
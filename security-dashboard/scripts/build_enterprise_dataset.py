@@ -4,56 +4,98 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import re
 from typing import Dict, List, Tuple
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 DASHBOARD_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_OUTPUT = DASHBOARD_ROOT / "data" / "ingest" / "enterprise-events.jsonl"
+METADATA_CACHE_NAME = ".build_enterprise_cache.json"
+SECURITY_SCRIPTS_DIR = REPO_ROOT / "Security_Scripts"
+IDS_RULES_DIR = REPO_ROOT / "custom-ids" / "rules"
+ANSIBLE_PLAYBOOKS_DIR = REPO_ROOT / "ansible-hardening" / "playbooks"
+BLOCKCHAIN_DIR = REPO_ROOT / "blockchain-secure-logging"
+QUANTUM_DIR = REPO_ROOT / "quantum-computing"
+RULE_EXAMPLE_LIMIT = 4
+# Matches a rule's first msg and sid options in either order with one search.
+RULE_RE = re.compile(r'msg:"([^"]+)".*?sid:(\d+)|sid:(\d+).*?msg:"([^"]+)"')
 
 
-def _utc_timestamp(minutes_ago: int = 0) -> str:
-    ts = datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)
-    return ts.strftime("%Y-%m-%dT%H:%M:%SZ")
+def _utc_timestamp(now: datetime, minutes_ago: int = 0) -> str:
+    # ``now`` is naive UTC truncated to whole seconds (see main), so isoformat()
+    # yields the same "%Y-%m-%dT%H:%M:%SZ" text as strftime, only faster.
+    return (now - timedelta(minutes=minutes_ago)).isoformat() + "Z"
 
 
 def _list_dirs(path: Path) -> List[str]:
-    if not path.exists():
+    # DirEntry.is_dir() answers from the directory listing itself, so no
+    # per-entry stat is needed.
+    try:
+        with os.scandir(path) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir() and not entry.name.startswith("."))
+    except FileNotFoundError:
         return []
-    return sorted([p.name for p in path.iterdir() if p.is_dir() and not p.name.startswith(".")])
 
 
-def _extract_rule_examples(rule_files: List[Path]) -> List[Tuple[str, str]]:
+def _list_files(path: Path, suffix: str) -> List[str]:
+    # Directory order, as the previous ``Path.glob(f"*{suffix}")`` calls returned.
+    try:
+        with os.scandir(path) as entries:
+            return [entry.name for entry in entries if entry.name.endswith(suffix) and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def _scan_rule_file(rule_file: Path) -> List[Tuple[str, str]]:
     examples: List[Tuple[str, str]] = []
-    for rule_file in rule_files:
-        if not rule_file.exists():
-            continue
-        for line in rule_file.read_text().splitlines():
+    if not rule_file.exists():
+        return examples
+    with rule_file.open("r", encoding="utf-8") as handle:
+        for line in handle:
             if "msg:" in line and "sid:" in line:
-                msg_match = re.search(r'msg:\"([^\"]+)\"', line)
-                sid_match = re.search(r'sid:(\d+)', line)
-                if msg_match and sid_match:
-                    examples.append((sid_match.group(1), msg_match.group(1)))
-            if len(examples) >= 4:
-                return examples
+                match = RULE_RE.search(line)
+                if match:
+                    msg, sid, sid_first, msg_last = match.groups()
+                    examples.append((sid or sid_first, msg or msg_last))
+                    if len(examples) >= RULE_EXAMPLE_LIMIT:
+                        break
     return examples
 
 
-def _collect_metadata() -> Dict[str, object]:
-    security_scripts_dir = REPO_ROOT / "Security_Scripts"
-    ids_rules_dir = REPO_ROOT / "custom-ids" / "rules"
-    ansible_playbooks_dir = REPO_ROOT / "ansible-hardening" / "playbooks"
-    blockchain_dir = REPO_ROOT / "blockchain-secure-logging"
-    quantum_dir = REPO_ROOT / "quantum-computing"
+def _extract_rule_examples(rule_files: List[Path]) -> List[Tuple[str, str]]:
+    examples: List[Tuple[str, str]] = []
+    if not rule_files:
+        return examples
+    # Files are read concurrently, but results are merged in list order so the
+    # chosen examples match a sequential scan; files not yet started once the
+    # limit is reached are cancelled.
+    with ThreadPoolExecutor(max_workers=min(8, len(rule_files))) as executor:
+        futures = [executor.submit(_scan_rule_file, rule_file) for rule_file in rule_files]
+        for future in futures:
+            examples.extend(future.result())
+            if len(examples) >= RULE_EXAMPLE_LIMIT:
+                for pending in futures:
+                    pending.cancel()
+                break
+    return examples[:RULE_EXAMPLE_LIMIT]
+
 
+def _collect_metadata() -> Dict[str, object]:
     metadata: Dict[str, object] = {
-        "security_scripts": _list_dirs(security_scripts_dir),
-        "ids_rule_files": [p.name for p in ids_rules_dir.glob("*.rules")],
-        "ansible_playbooks": [p.name for p in ansible_playbooks_dir.glob("*.yml")],
-        "blockchain_components": _list_dirs(blockchain_dir),
-        "quantum_documents": [p.name for p in quantum_dir.glob("*.md")],
+        "security_scripts": _list_dirs(SECURITY_SCRIPTS_DIR),
+        "ids_rule_files": _list_files(IDS_RULES_DIR, ".rules"),
+        "ansible_playbooks": _list_files(ANSIBLE_PLAYBOOKS_DIR, ".yml"),
+        "blockchain_components": _list_dirs(BLOCKCHAIN_DIR),
+        "quantum_documents": _list_files(QUANTUM_DIR, ".md"),
     }
     metadata["security_scripts_count"] = len(metadata["security_scripts"])  # type: ignore[index]
     metadata["ansible_playbook_count"] = len(metadata["ansible_playbooks"])  # type: ignore[index]
@@ -61,12 +103,48 @@ def _collect_metadata() -> Dict[str, object]:
     metadata["quantum_document_count"] = len(metadata["quantum_documents"])  # type: ignore[index]
     metadata["ids_rule_file_count"] = len(metadata["ids_rule_files"])  # type: ignore[index]
     metadata["ids_rule_examples"] = _extract_rule_examples(
-        [ids_rules_dir / name for name in metadata["ids_rule_files"]]  # type: ignore[index]
+        [IDS_RULES_DIR / name for name in metadata["ids_rule_files"]]  # type: ignore[index]
     )
     return metadata
 
 
-def _build_events(metadata: Dict[str, object]) -> List[Dict[str, object]]:
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return -1
+
+
+def _metadata_cache_key() -> Dict[str, int]:
+    # Directory mtimes change when entries are added, removed or renamed; rule
+    # files are keyed individually because their contents are read as well.
+    directories = (SECURITY_SCRIPTS_DIR, IDS_RULES_DIR, ANSIBLE_PLAYBOOKS_DIR, BLOCKCHAIN_DIR, QUANTUM_DIR)
+    key = {str(directory): _mtime_ns(directory) for directory in directories}
+    for name in _list_files(IDS_RULES_DIR, ".rules"):
+        key[str(IDS_RULES_DIR / name)] = _mtime_ns(IDS_RULES_DIR / name)
+    return key
+
+
+def _load_metadata(cache_path: Path) -> Dict[str, object]:
+    """Return repository metadata, reusing ``cache_path`` while the repo is unchanged."""
+
+    key = _metadata_cache_key()
+    try:
+        cached = json.loads(cache_path.read_bytes())
+    except (FileNotFoundError, ValueError):
+        cached = None
+    if isinstance(cached, dict) and cached.get("key") == key:
+        metadata = cached["metadata"]
+        metadata["ids_rule_examples"] = [tuple(example) for example in metadata["ids_rule_examples"]]
+        return metadata
+
+    metadata = _collect_metadata()
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps({"key": key, "metadata": metadata}), encoding="utf-8")
+    return metadata
+
+
+def _build_events(metadata: Dict[str, object], now: datetime) -> List[Dict[str, object]]:
     events: List[Dict[str, object]] = []
 
     recon_scripts = metadata.get("security_scripts", [])
@@ -75,7 +153,7 @@ def _build_events(metadata: Dict[str, object]) -> List[Dict[str, object]]:
     events.append(
         {
             "target_index": "security-scans",
-            "timestamp": _utc_timestamp(5),
+            "timestamp": _utc_timestamp(now, 5),
             "host": "10.20.5.17",
             "tool": f"Security_Scripts/{recon_tool}",
             "service": "https",
@@ -90,7 +168,7 @@ def _build_events(metadata: Dict[str, object]) -> List[Dict[str, object]]:
     events.append(
         {
             "target_index": "security-scans",
-            "timestamp": _utc_timestamp(4),
+            "timestamp": _utc_timestamp(now, 4),
             "host": "10.20.8.44",
             "tool": "Security_Scripts/vuln_check",
             "vulnerability": "CVE-2024-34985",
@@ -107,7 +185,7 @@ def _build_events(metadata: Dict[str, object]) -> List[Dict[str, object]]:
     events.append(
         {
             "target_index": "ids-alerts",
-            "timestamp": _utc_timestamp(3),
+            "timestamp": _utc_timestamp(now, 3),
             "sensor": "custom-ids/suricata01",
             "rule_id": int(rule_sid),
             "rule_name": rule_msg,
@@ -123,7 +201,7 @@ def _build_events(metadata: Dict[str, object]) -> List[Dict[str, object]]:
     events.append(
         {
             "target_index": "ids-alerts",
-            "timestamp": _utc_timestamp(2),
+            "timestamp": _utc_timestamp(now, 2),
             "sensor": "custom-ids/suricata02",
             "rule_id": 2100801,
             "rule_name": "ETP OT BACnet writeProperty",
@@ -139,7 +217,7 @@ def _build_events(metadata: Dict[str, object]) -> List[Dict[str, object]]:
     events.append(
         {
             "target_index": "ansible-compliance",
-            "timestamp": _utc_timestamp(10),
+            "timestamp": _utc_timestamp(now, 10),
             "host": "linux-bastion-01",
             "playbook": "ansible-hardening/playbooks/hardening.yml",
             "control": "cis_2_2_enable_firewalld",
@@ -153,7 +231,7 @@ def _build_events(metadata: Dict[str, object]) -> List[Dict[str, object]]:
     events.append(
         {
             "target_index": "ansible-compliance",
-            "timestamp": _utc_timestamp(9),
+            "timestamp": _utc_timestamp(now, 9),
             "host": "linux-bastion-02",
             "playbook": "ansible-hardening/playbooks/hardening.yml",
             "control": "cis_5_1_auditd_config",
@@ -164,16 +242,17 @@ def _build_events(metadata: Dict[str, object]) -> List[Dict[str, object]]:
         }
     )
 
+    anchored_at = _utc_timestamp(now, 6)
     events.append(
         {
             "target_index": "blockchain-audit",
-            "timestamp": _utc_timestamp(6),
+            "timestamp": anchored_at,
             "ledger": "blockchain-secure-logging",
             "tx_id": "0x8a2f9b7c8d",
             "status": "anchored",
             "chain": "ethereum-goerli",
             "hash": "f6c1b8f1e4f83d50e6c35a5d88777d1a",
-            "evidence_batch": _utc_timestamp(6)[:13],
+            "evidence_batch": anchored_at[:13],
             "source_reference": "blockchain-secure-logging/onchain",
         }
     )
@@ -181,7 +260,7 @@ def _build_events(metadata: Dict[str, object]) -> List[Dict[str, object]]:
     events.append(
         {
             "target_index": "mobile-findings",
-            "timestamp": _utc_timestamp(25),
+            "timestamp": _utc_timestamp(now, 25),
             "application": "com.example.securebank",
             "report": "mobile-security-analysis/analyze_apk.py",
             "risk_score": 72,
@@ -194,7 +273,7 @@ def _build_events(metadata: Dict[str, object]) -> List[Dict[str, object]]:
     events.append(
         {
             "target_index": "quantum-research",
-            "timestamp": _utc_timestamp(30),
+            "timestamp": _utc_timestamp(now, 30),
             "experiment": "QRNGSteganography.md",
             "metric": "entropy_bits_per_byte",
             "value": 7.94,
@@ -207,7 +286,7 @@ def _build_events(metadata: Dict[str, object]) -> List[Dict[str, object]]:
     events.append(
         {
             "target_index": "platform-inventory",
-            "timestamp": _utc_timestamp(),
+            "timestamp": _utc_timestamp(now),
             "component": "repository-health",
             "security_scripts": metadata.get("security_scripts_count", 0),
             "ids_rule_files": metadata.get("ids_rule_file_count", 0),
@@ -222,21 +301,30 @@ def _build_events(metadata: Dict[str, object]) -> List[Dict[str, object]]:
     return events
 
 
+def _encode_events(events: List[Dict[str, object]]) -> bytes:
+    if orjson is not None:
+        return b"".join(orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE) for event in events)
+    return "".join(json.dumps(event) + "\n" for event in events).encode("utf-8")
+
+
 def _write_events(events: List[Dict[str, object]], output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as handle:
-        for event in events:
-            handle.write(json.dumps(event))
-            handle.write("\n")
+    output_path.write_bytes(_encode_events(events))
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Path to the JSON Lines file to generate")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Rescan the repository instead of reusing {METADATA_CACHE_NAME} next to the output file",
+    )
     args = parser.parse_args()
 
-    metadata = _collect_metadata()
-    events = _build_events(metadata)
+    metadata = _collect_metadata() if args.no_cache else _load_metadata(args.output.parent / METADATA_CACHE_NAME)
+    now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    events = _build_events(metadata, now)
     _write_events(events, args.output)
     print(f"Wrote {len(events)} events to {args.output}")
 